@@ -1,16 +1,46 @@
 # solbotC.py
 import os
+import queue
+import random
+import re
 import time
+import ijson
+import orjson
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from threading import Thread
-from flask import Flask
+from threading import Lock, RLock, Thread
+from base64 import b64decode
+from cachetools import TTLCache
 from dotenv import load_dotenv
-from solana.rpc.api import Client
-from solders.pubkey import Pubkey
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pybloom_live import ScalableBloomFilter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 load_dotenv()
 
+
+def make_session():
+    """
+    Build the shared HTTP session (keep-alive + retries).
+    Kept as a factory so tests can inject their own session.
+    """
+    s = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+    )
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    s.headers.update({"Accept": "application/json", "Connection": "keep-alive"})
+    return s
+
+
+SESSION = make_session()
+
 # === Configuration ===
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
@@ -19,6 +49,12 @@ TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
 DEX_SEARCH_URL = "https://api.dexscreener.io/latest/dex/search?q=solana"
 DEX_TOKEN_ENDPOINT = "https://api.dexscreener.com/latest/dex/tokens/"
 
+# Matches pump.fun mentions in pair metadata (header/imageUrl)
+PUMPFUN_RE = re.compile(r"pumpfun", re.I)
+
+# SPL Token program (owner of all token accounts)
+TOKEN_PROGRAM_ID = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+
 # Solana RPC endpoints (rotate on failures)
 RPC_URLS = [
     "https://api.mainnet-beta.solana.com",
@@ -28,118 +64,488 @@ RPC_URLS = [
 ]
 
 # Monitoring / thresholds
-POLL_INTERVAL = int(os.getenv("POLL_INTERVAL", "60"))  # seconds
-MAX_WATCH_MINUTES = 60
-MIN_FDV = 80_000
-MAX_FDV = 300_000
-MIN_VOLUME_24H = 200_000
-MAX_TOP10_PCT = 25.0
-MIN_HOLDERS = 250
+@dataclass(frozen=True)
+class WatcherConfig:
+    """
+    Feed + filter settings for one watcher pipeline. Everything the
+    monitor loop tunes lives here, so a variant deployment (different
+    feed, thresholds or cadence) is another instance, not another
+    copy of the script.
+    """
+
+    search_url: str = DEX_SEARCH_URL
+    poll_interval: int = int(os.getenv("POLL_INTERVAL", "60"))  # seconds
+    max_watch_minutes: float = 60
+    min_fdv: float = 80_000
+    max_fdv: float = 300_000
+    min_volume_24h: float = 200_000
+    max_top10_pct: float = 25.0
+    min_holders: int = 250
+
+
+CFG = WatcherConfig()
 
 # Internal state
 WATCHLIST = {}  # ca -> {"first_seen_ts": epoch, "alert_sent": bool, "symbol": str, "pair_url": str}
-SEEN_FOREVER = set()  # tokens already alerted (keeps them suppressed forever)
+WATCHLIST_CAP = 5_000  # safety bound; entries normally expire via the watch window
+_STATE_LOCK = RLock()  # guards WATCHLIST across the monitor threads (SeenStore locks itself)
+
 
-app = Flask(__name__)
+class Breaker:
+    """
+    Minimal circuit breaker for an upstream host: after 3 consecutive
+    failures, calls are skipped for an exponentially growing window
+    (with jitter, capped at 60s); the first success closes it again.
+    """
+
+    FAILURE_THRESHOLD = 3
+    MAX_BACKOFF = 60.0
+
+    def __init__(self):
+        self._failures = 0
+        self._open_until = 0.0
+        self._lock = Lock()
+
+    def allow(self):
+        with self._lock:
+            return time.time() >= self._open_until
+
+    def record(self, ok):
+        with self._lock:
+            if ok:
+                self._failures = 0
+                self._open_until = 0.0
+            else:
+                self._failures += 1
+                if self._failures >= self.FAILURE_THRESHOLD:
+                    n = self._failures - self.FAILURE_THRESHOLD
+                    delay = min(2.0 ** n, self.MAX_BACKOFF)
+                    self._open_until = time.time() + delay + random.random()
+
+
+class SeenStore:
+    """
+    Dedup store for already-alerted tokens. A scalable Bloom filter keeps
+    the in-process copy at O(bits) per entry (a rare false positive just
+    skips an alert). If REDIS_URL is set, entries are mirrored to Redis
+    with a 24h TTL so a restart doesn't re-alert still-fresh tokens and
+    replicas can share suppression. Checks hit the local filter first,
+    so only unseen tokens ever reach Redis, and a Breaker latches Redis
+    off after consecutive failures — a dead/black-holed Redis costs one
+    connect timeout per backoff window, not one per token. The store
+    locks its own filter, so callers need no external lock.
+    """
+
+    def __init__(self):
+        self._bloom = ScalableBloomFilter(initial_capacity=10_000, error_rate=1e-4)
+        self._lock = Lock()
+        self._breaker = Breaker()
+        self._redis = None
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url:
+            # REDIS_URL is the activation knob for restart-safe dedup; if
+            # the redis package is missing or the URL is malformed, crash
+            # at startup rather than silently running local-only
+            import redis
+
+            self._redis = redis.Redis.from_url(
+                redis_url,
+                decode_responses=True,
+                socket_connect_timeout=1,
+                socket_timeout=1,
+            )
+
+    def __contains__(self, ca):
+        # local filter first: a hit is ~µs and skips the round-trip
+        with self._lock:
+            if ca in self._bloom:
+                return True
+        if self._redis is not None and self._breaker.allow():
+            try:
+                found = self._redis.exists(f"seen:{ca}")
+            except Exception:
+                self._breaker.record(False)
+            else:
+                self._breaker.record(True)
+                if found:
+                    # backfill so the next check for this CA stays local
+                    with self._lock:
+                        self._bloom.add(ca)
+                    return True
+        return False
+
+    def add(self, ca):
+        with self._lock:
+            self._bloom.add(ca)
+        if self._redis is not None and self._breaker.allow():
+            try:
+                self._redis.set(f"seen:{ca}", 1, ex=86_400)
+            except Exception:
+                self._breaker.record(False)
+            else:
+                self._breaker.record(True)
+
+
+# Tokens already alerted (suppressed; see SeenStore for semantics)
+SEEN_FOREVER = SeenStore()
+
+# Worker pool for the watchlist pass: each token's checks are independent
+# network I/O, so they can overlap instead of paying one RTT per token.
+EXECUTOR = ThreadPoolExecutor(max_workers=16)
 
 
 # === Telegram ===
+# Alerts go through a queue drained by a dedicated sender thread, so a
+# slow Telegram response can't stall the monitor loop.
+_tg_queue = queue.Queue(maxsize=1000)
+
+
+def telegram_sender_loop():
+    while True:
+        chunk = [_tg_queue.get()]
+        # Coalesce whatever a burst already queued (up to 8 alerts, well
+        # under Telegram's 4096-char cap) into one message per call.
+        while len(chunk) < 8:
+            try:
+                chunk.append(_tg_queue.get_nowait())
+            except queue.Empty:
+                break
+        text = "\n\n".join(chunk)
+        try:
+            url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
+            SESSION.post(url, data={"chat_id": TELEGRAM_CHAT_ID, "text": text, "parse_mode": "Markdown"}, timeout=10)
+        except Exception:
+            # Silent: we purposely avoid console logs
+            pass
+
+
 def send_telegram(text: str):
     if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
         return
     try:
-        url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-        requests.post(url, data={"chat_id": TELEGRAM_CHAT_ID, "text": text, "parse_mode": "Markdown"}, timeout=10)
-    except Exception:
-        # Silent: we purposely avoid console logs
+        _tg_queue.put_nowait(text)
+    except queue.Full:
+        # drop rather than block the monitor loop
         pass
 
 
+# === Solana RPC pool ===
+class RpcPool:
+    """
+    Round-robin over the RPC endpoints with a per-endpoint circuit breaker.
+
+    Endpoints are hit with raw JSON-RPC POSTs over the shared SESSION so
+    independent calls can ride one batch. After 3 consecutive failures an
+    endpoint is skipped (breaker open) with exponential backoff plus
+    jitter, capped at 30s; once the backoff elapses it gets a single probe
+    and recovers on success.
+    """
+
+    FAILURE_THRESHOLD = 3
+    MAX_BACKOFF = 30.0
+    HEDGE_WIDTH = 2  # endpoints raced per batch
+
+    def __init__(self, urls):
+        self._entries = [{"url": u, "failures": 0, "open_until": 0.0} for u in urls]
+        self._next = 0
+        self._lock = Lock()
+        # dedicated pool for hedged posts, so racing endpoints never
+        # competes with the watchlist workers for threads
+        self._hedge_pool = ThreadPoolExecutor(max_workers=8)
+
+    def _pick(self):
+        # next endpoint whose breaker is not open, or None if all are open
+        with self._lock:
+            now = time.time()
+            for _ in range(len(self._entries)):
+                entry = self._entries[self._next % len(self._entries)]
+                self._next += 1
+                if now >= entry["open_until"]:
+                    return entry
+        return None
+
+    def _record_failure(self, entry):
+        with self._lock:
+            entry["failures"] += 1
+            if entry["failures"] >= self.FAILURE_THRESHOLD:
+                n = entry["failures"] - self.FAILURE_THRESHOLD
+                delay = min(2.0 ** n, self.MAX_BACKOFF)
+                entry["open_until"] = time.time() + delay + random.uniform(0, 0.3 * delay)
+
+    def _record_success(self, entry):
+        with self._lock:
+            entry["failures"] = 0
+            entry["open_until"] = 0.0
+
+    def _post(self, entry, body):
+        r = SESSION.post(
+            entry["url"],
+            data=body,
+            headers={"Content-Type": "application/json"},
+            timeout=10,
+        )
+        if r.status_code != 200:
+            raise ValueError(f"HTTP {r.status_code}")
+        replies = orjson.loads(r.content)
+        if not isinstance(replies, list):
+            raise ValueError("non-batch reply")
+        results = {}
+        for rep in replies:
+            # a sub-reply without "result" carries an "error" member;
+            # treat that as an endpoint failure so the breaker sees it
+            if "result" not in rep:
+                raise ValueError(str(rep.get("error") or "missing result"))
+            results[rep.get("id")] = rep["result"]
+        return results
+
+    def call_batch(self, reqs):
+        """
+        POST a JSON-RPC batch (list of request dicts), racing it against
+        up to HEDGE_WIDTH healthy endpoints and keeping the first good
+        reply — tail latency tracks the fastest endpoint, not a flapping
+        one. Falls through further waves on failure. Returns {id: result}
+        on success, or None if every endpoint failed/is open.
+        """
+        body = orjson.dumps(reqs)
+        tried = 0
+        while tried < len(self._entries):
+            wave = []
+            while len(wave) < self.HEDGE_WIDTH and tried < len(self._entries):
+                entry = self._pick()
+                if entry is None or any(e is entry for e in wave):
+                    break
+                wave.append(entry)
+                tried += 1
+            if not wave:
+                break
+            futures = {self._hedge_pool.submit(self._post, e, body): e for e in wave}
+            for fut in as_completed(futures):
+                entry = futures[fut]
+                try:
+                    result = fut.result()
+                except Exception:
+                    self._record_failure(entry)
+                    continue
+                self._record_success(entry)
+                # losers finish in the background; nothing waits on them
+                return result
+        return None
+
+
+RPC_POOL = RpcPool(RPC_URLS)
+
+# Holder stats move on minute scale, not per poll; cache them so a token
+# watched for an hour doesn't hit the RPC ~60x for the same answer.
+# TTLCache isn't thread-safe and the watchlist workers share this one.
+_holder_cache = TTLCache(maxsize=1024, ttl=300)
+_holder_lock = Lock()
+
+
 # === On-chain helpers ===
 def get_onchain_top10_holders(mint_address: str):
     """
     Return (supply, holders_count, top10_pct)
     If RPC calls fail, return (0.0, 0, 0.0)
     """
-    for rpc in RPC_URLS:
-        try:
-            client = Client(rpc)
-            mint = Pubkey.from_string(mint_address)
-
-            supply_resp = client.get_token_supply(mint)
-            if not hasattr(supply_resp, "value"):
-                continue
-            supply = float(supply_resp.value.ui_amount or 0.0)
-
-            largest_resp = client.get_token_largest_accounts(mint)
-            accounts = getattr(largest_resp, "value", []) or []
-            holders = len(accounts)
-            top10_sum = 0.0
-            for a in accounts[:10]:
-                # each a has .ui_amount
-                amt = getattr(a, "ui_amount", 0.0)
-                top10_sum += float(amt or 0.0)
-            top10_pct = (top10_sum / supply * 100.0) if supply > 0 else 0.0
-            return supply, holders, top10_pct
-        except Exception:
-            # try next RPC
-            time.sleep(0.2)
-            continue
-    return 0.0, 0, 0.0
+    with _holder_lock:
+        cached = _holder_cache.get(mint_address)
+    if cached is not None:
+        return cached
+    try:
+        # supply + largest accounts + holder count in one round-trip.
+        # getTokenLargestAccounts caps at 20 entries, so the holder count
+        # comes from getProgramAccounts instead: token accounts for this
+        # mint, sliced down to just the 8-byte amount field.
+        replies = RPC_POOL.call_batch([
+            {"jsonrpc": "2.0", "id": 1, "method": "getTokenSupply", "params": [mint_address]},
+            {"jsonrpc": "2.0", "id": 2, "method": "getTokenLargestAccounts", "params": [mint_address]},
+            {
+                "jsonrpc": "2.0",
+                "id": 3,
+                "method": "getProgramAccounts",
+                "params": [
+                    TOKEN_PROGRAM_ID,
+                    {
+                        "encoding": "base64",
+                        "dataSlice": {"offset": 64, "length": 8},
+                        "filters": [
+                            {"dataSize": 165},
+                            {"memcmp": {"offset": 0, "bytes": mint_address}},
+                        ],
+                    },
+                ],
+            },
+        ])
+        if not replies or any(replies.get(i) is None for i in (1, 2, 3)):
+            # partial/failed batch: return the sentinel uncached so the
+            # next pass retries instead of pinning zeros for 5 minutes
+            return 0.0, 0, 0.0
+        supply_value = (replies.get(1) or {}).get("value") or {}
+        supply = float(supply_value.get("uiAmount") or 0.0)
+
+        accounts = (replies.get(2) or {}).get("value") or []
+        top10_sum = 0.0
+        for a in accounts[:10]:
+            top10_sum += float(a.get("uiAmount") or 0.0)
+        top10_pct = (top10_sum / supply * 100.0) if supply > 0 else 0.0
+
+        holders = 0
+        for acc in replies.get(3) or []:
+            data = ((acc.get("account") or {}).get("data") or [""])[0]
+            if data and int.from_bytes(b64decode(data), "little"):
+                holders += 1
+        result = (supply, holders, top10_pct)
+        with _holder_lock:
+            _holder_cache[mint_address] = result
+        return result
+    except Exception:
+        # failures are not cached so the next pass retries
+        return 0.0, 0, 0.0
 
 
 # === DexScreener helpers ===
 def fetch_dex_search():
     """
-    Fetch the search feed for Solana pairs.
-    Returns list of pairs or empty list on failure.
+    Stream the search feed for Solana pairs.
+    Yields pair dicts one at a time; yields nothing on failure.
+    The ~1 MB response never gets materialized as a whole — only the
+    current pair dict is alive at any point.
     """
     try:
-        r = requests.get(DEX_SEARCH_URL, timeout=15)
-        if r.status_code != 200 or not r.text:
-            return []
-        data = r.json()
-        return data.get("pairs", []) or []
+        with SESSION.get(CFG.search_url, timeout=15, stream=True) as r:
+            if r.status_code != 200:
+                return
+            r.raw.decode_content = True  # ijson reads the raw (gzip'd) stream
+            yield from ijson.items(r.raw, "pairs.item")
     except Exception:
-        return []
+        return
+
+
+# DexScreener token endpoint gets its own breaker; when it trips, lookups
+# fall back to the stale copies below instead of hammering a 429ing host.
+DEX_BREAKER = Breaker()
+
+# Short-TTL cache over token lookups so concurrent checks of the same CA
+# collapse into one request; a longer-lived copy backs stale-while-error
+# (DexScreener rate-limits aggressively, better stale than nothing).
+_pair_cache = TTLCache(maxsize=2048, ttl=15)
+_pair_stale = TTLCache(maxsize=2048, ttl=300)
+_pair_lock = Lock()
 
 
 def fetch_token_pair_by_mint(mint_address: str):
     """
-    Fetch token's pairs via DexScreener token endpoint.
-    Returns the highest-volume pair dict or None.
+    Fetch token's pairs via DexScreener token endpoint (cached ~15s).
+    Returns the highest-volume pair dict or None. On 429/5xx/network
+    errors, serves the last known pair for the mint if there is one.
     """
+    with _pair_lock:
+        cached = _pair_cache.get(mint_address)
+    if cached is not None:
+        return cached
+    if not DEX_BREAKER.allow():
+        with _pair_lock:
+            return _pair_stale.get(mint_address)
     try:
-        r = requests.get(f"{DEX_TOKEN_ENDPOINT}{mint_address}", timeout=10)
-        if r.status_code != 200 or not r.text:
-            return None
-        data = r.json()
+        r = SESSION.get(f"{DEX_TOKEN_ENDPOINT}{mint_address}", timeout=10)
+        if r.status_code != 200 or not r.content:
+            raise ValueError(f"HTTP {r.status_code}")
+        data = orjson.loads(r.content)
+        DEX_BREAKER.record(True)
         pairs = data.get("pairs", []) or []
         if not pairs:
             return None
-        pair = max(pairs, key=lambda x: x.get("volume", {}).get("h24", 0) or 0)
+        # single-pass scan for the highest-volume pair (no key-lambda)
+        pair, best_v = None, -1.0
+        for p in pairs:
+            v = p.get("volume")
+            v = (v.get("h24") if v else 0) or 0
+            if v > best_v:
+                best_v, pair = v, p
+        with _pair_lock:
+            _pair_cache[mint_address] = pair
+            _pair_stale[mint_address] = pair
         return pair
     except Exception:
-        return None
+        # stale-while-error: fall back to the last good answer
+        DEX_BREAKER.record(False)
+        with _pair_lock:
+            return _pair_stale.get(mint_address)
+
+
+def fetch_token_pairs_by_mints(mints):
+    """
+    Batch-fetch pairs for many mints: the token endpoint accepts up to 30
+    comma-separated addresses per call, so K lookups cost ceil(K/30)
+    round-trips. The per-mint caches are populated with each mint's
+    highest-volume pair, and {mint: pair} is returned for whatever
+    DexScreener knew about.
+    """
+    out = {}
+    mints = list(mints)
+    for i in range(0, len(mints), 30):
+        if not DEX_BREAKER.allow():
+            break
+        chunk = mints[i:i + 30]
+        try:
+            r = SESSION.get(DEX_TOKEN_ENDPOINT + ",".join(chunk), timeout=10)
+            if r.status_code != 200 or not r.content:
+                raise ValueError(f"HTTP {r.status_code}")
+            pairs = orjson.loads(r.content).get("pairs", []) or []
+            DEX_BREAKER.record(True)
+        except Exception:
+            DEX_BREAKER.record(False)
+            continue
+        best = {}  # mint -> (volume, pair)
+        for p in pairs:
+            ca = (p.get("baseToken") or {}).get("address")
+            if not ca:
+                continue
+            v = p.get("volume")
+            v = (v.get("h24") if v else 0) or 0
+            cur = best.get(ca)
+            if cur is None or v > cur[0]:
+                best[ca] = (v, p)
+        with _pair_lock:
+            for ca, (_, p) in best.items():
+                _pair_cache[ca] = p
+                _pair_stale[ca] = p
+                out[ca] = p
+    return out
 
 
 # === Alert formatting ===
+# Body assembled once at import; per-alert we only fill in the slots.
+ALERT_TEMPLATE = (
+    "🔥 *Pump.fun Graduate Detected* 🔥\n\n"
+    "💠 *Token:* $%s\n"
+    "🧾 *CA:* `%s`\n"
+    "💰 *Market Cap (FDV):* $%s\n"
+    "📈 *24h Volume:* $%s\n"
+    "💧 *Liquidity:* $%s\n"
+    "🏦 *Top 10 wallets:* %.2f%%\n"
+    "👥 *Holders:* %d\n"
+    "🕒 *Age:* %.0f min\n"
+    "🧩 *DEX:* %s\n\n"
+    "🔗 [DexScreener](%s)"
+)
+
+
 def format_alert(pair, ca, fdv, volume, liquidity, top10pct, holders, age_min):
     symbol = pair.get("baseToken", {}).get("symbol", ca[:6])
     dex = pair.get("dexId", "unknown")
     url = pair.get("url", "")
-    return (
-        f"🔥 *Pump.fun Graduate Detected* 🔥\n\n"
-        f"💠 *Token:* ${symbol}\n"
-        f"🧾 *CA:* `{ca}`\n"
-        f"💰 *Market Cap (FDV):* ${fdv:,.0f}\n"
-        f"📈 *24h Volume:* ${volume:,.0f}\n"
-        f"💧 *Liquidity:* ${liquidity:,.0f}\n"
-        f"🏦 *Top 10 wallets:* {top10pct:.2f}%\n"
-        f"👥 *Holders:* {holders}\n"
-        f"🕒 *Age:* {age_min:.0f} min\n"
-        f"🧩 *DEX:* {dex}\n\n"
-        f"🔗 [DexScreener]({url})"
+    return ALERT_TEMPLATE % (
+        symbol,
+        ca,
+        f"{fdv:,.0f}",
+        f"{volume:,.0f}",
+        f"{liquidity:,.0f}",
+        top10pct,
+        holders,
+        age_min,
+        dex,
+        url,
     )
 
 
@@ -147,20 +553,23 @@ def format_alert(pair, ca, fdv, volume, liquidity, top10pct, holders, age_min):
 def update_watchlist_from_search():
     """
     Scan DexScreener search results and populate/update WATCHLIST for Pump.fun graduates.
+    Returns the number of pairs seen (0 signals an empty/unreachable feed).
     """
     pairs = fetch_dex_search()
     now = time.time()
+    seen_pairs = 0
     # Build quick lookup of current pairs by mint for efficiency
     for p in pairs:
+        seen_pairs += 1
         try:
-            info = p.get("info", {}) or {}
+            info = p.get("info") or {}
             # Identify pump.fun graduates: sourceId == 'pumpfun' OR info mentions pumpfun
-            is_pumpfun = (info.get("sourceId") == "pumpfun") or ("pumpfun" in info.get("header", "") or "pumpfun" in info.get("imageUrl", ""))
-            # Also allow if p contains 'labels' or 'tags' referencing pumpfun (optional)
-            if not is_pumpfun:
+            if info.get("sourceId") != "pumpfun" and not PUMPFUN_RE.search(
+                (info.get("header") or "") + "\x00" + (info.get("imageUrl") or "")
+            ):
                 continue
 
-            base = p.get("baseToken", {}) or {}
+            base = p.get("baseToken") or {}
             ca = base.get("address")
             if not ca:
                 continue
@@ -174,114 +583,173 @@ def update_watchlist_from_search():
                 age_min = (p.get("age", 0) or 0) / 60.0
                 created_ts = time.time() - (p.get("age", 0) or 0)
 
-            if age_min > MAX_WATCH_MINUTES:
+            if age_min > CFG.max_watch_minutes:
                 continue
 
             # Keep or add to WATCHLIST if not already alerted forever
+            # (outside _STATE_LOCK: the store may hit Redis over the wire)
             if ca in SEEN_FOREVER:
                 continue
 
             # Populate watchlist entry if not present
-            if ca not in WATCHLIST:
-                WATCHLIST[ca] = {
-                    "first_seen_ts": created_ts,
-                    "alert_sent": False,
-                    "symbol": base.get("symbol", ""),
-                    "pair_snapshot": p,
-                }
-            else:
-                # update snapshot so subsequent checks use fresh data
-                WATCHLIST[ca]["pair_snapshot"] = p
+            with _STATE_LOCK:
+                if ca not in WATCHLIST:
+                    if len(WATCHLIST) >= WATCHLIST_CAP:
+                        # evict the oldest entry (dicts keep insertion order)
+                        WATCHLIST.pop(next(iter(WATCHLIST)), None)
+                    WATCHLIST[ca] = {
+                        "first_seen_ts": created_ts,
+                        "alert_sent": False,
+                        "symbol": base.get("symbol", ""),
+                        "pair_snapshot": p,
+                    }
+                else:
+                    # update snapshot so subsequent checks use fresh data
+                    WATCHLIST[ca]["pair_snapshot"] = p
 
         except Exception:
             # silent
             continue
+    return seen_pairs
+
+
+def _evaluate_one(ca, meta, now):
+    """
+    Evaluate a single watchlist entry without touching shared state.
+    Returns (ca, action, alert_text) where action is "alert", "remove" or None.
+    """
+    try:
+        first_seen = meta.get("first_seen_ts", now)
+        age_min = (now - first_seen) / 60.0
+        if age_min > CFG.max_watch_minutes:
+            return ca, "remove", None
+
+        # latest pair: prefer the search snapshot, else the token endpoint
+        pair = meta.get("pair_snapshot")
+        if not pair:
+            pair = fetch_token_pair_by_mint(ca)
+            if not pair:
+                return ca, None, None
+
+        fdv = float(pair.get("fdv", 0) or 0)
+        volume24h = float(pair.get("volume", {}).get("h24", 0) or 0)
+        liquidity = float(pair.get("liquidity", {}).get("usd", 0) or 0)
+
+        # quick metric filter (fdv + volume)
+        if not (CFG.min_fdv <= fdv <= CFG.max_fdv):
+            return ca, None, None
+        if volume24h < CFG.min_volume_24h:
+            return ca, None, None
+
+        # on-chain metrics
+        _, holders, top10pct = get_onchain_top10_holders(ca)
+        if holders < CFG.min_holders:
+            return ca, None, None
+        if top10pct > CFG.max_top10_pct:
+            return ca, None, None
+
+        # All pass and alert not sent yet
+        if not meta.get("alert_sent", False):
+            text = format_alert(pair, ca, fdv, volume24h, liquidity, top10pct, holders, age_min)
+            return ca, "alert", text
+        return ca, None, None
+
+    except Exception:
+        # silent
+        return ca, None, None
 
 
 def evaluate_watchlist():
     """
-    For each token in WATCHLIST:
+    For each token in WATCHLIST (checked concurrently on the pool):
       - compute current age
       - get up-to-date pair data (use snapshot)
       - get fdv/volume/liquidity from pair or token endpoint
       - get on-chain holders/top10
       - if criteria met and alert not sent => send alert and mark SEEN_FOREVER
-      - remove entries older than MAX_WATCH_MINUTES
+      - remove entries older than the configured watch window
     """
-    now = time.time()
-    to_remove = []
-    for ca, meta in list(WATCHLIST.items()):
-        try:
-            first_seen = meta.get("first_seen_ts", now)
-            age_min = (now - first_seen) / 60.0
-            if age_min > MAX_WATCH_MINUTES:
-                to_remove.append(ca)
-                continue
-
-            # get latest pair (snapshot) and also try token endpoint to be safe
-            pair = meta.get("pair_snapshot") or fetch_token_pair_by_mint(ca)
-            if not pair:
-                # try token endpoint
-                pair = fetch_token_pair_by_mint(ca)
-                if not pair:
-                    continue
-
-            fdv = float(pair.get("fdv", 0) or 0)
-            volume24h = float(pair.get("volume", {}).get("h24", 0) or 0)
-            liquidity = float(pair.get("liquidity", {}).get("usd", 0) or 0)
-
-            # quick metric filter (fdv + volume)
-            if not (MIN_FDV <= fdv <= MAX_FDV):
-                continue
-            if volume24h < MIN_VOLUME_24H:
-                continue
+    global WATCHLIST
 
-            # on-chain metrics
-            _, holders, top10pct = get_onchain_top10_holders(ca)
-            if holders < MIN_HOLDERS:
-                continue
-            if top10pct > MAX_TOP10_PCT:
-                continue
+    now = time.time()
+    with _STATE_LOCK:
+        items = list(WATCHLIST.items())
+    if not items:
+        return
 
-            # All pass and alert not sent yet
-            if not meta.get("alert_sent", False):
-                text = format_alert(pair, ca, fdv, volume24h, liquidity, top10pct, holders, age_min)
-                send_telegram(text)
-                WATCHLIST[ca]["alert_sent"] = True
-                SEEN_FOREVER.add(ca)
-                # optional: we can remove after alert to save memory
-                to_remove.append(ca)
+    # Warm the pair cache for entries without a search snapshot in one
+    # batched request, so the workers below hit cache instead of issuing
+    # one token-endpoint GET each.
+    missing = [ca for ca, meta in items if not meta.get("pair_snapshot")]
+    if missing:
+        fetch_token_pairs_by_mints(missing)
 
-        except Exception:
-            # silent
-            continue
+    # Fan the per-token checks out over the pool; with N watched tokens
+    # a pass costs ~1 RTT instead of N serial RTTs. Workers only read,
+    # so all state mutation stays on this thread below.
+    results = list(EXECUTOR.map(lambda kv: _evaluate_one(kv[0], kv[1], now), items))
 
-    # cleanup
-    for ca in to_remove:
-        WATCHLIST.pop(ca, None)
+    to_remove = []
+    for ca, action, text in results:
+        if action == "alert":
+            # queueing the alert stays outside the lock on purpose
+            send_telegram(text)
+            with _STATE_LOCK:
+                if ca in WATCHLIST:
+                    WATCHLIST[ca]["alert_sent"] = True
+            # Redis round-trip, so keep it outside _STATE_LOCK
+            SEEN_FOREVER.add(ca)
+            # optional: we can remove after alert to save memory
+            to_remove.append(ca)
+        elif action == "remove":
+            to_remove.append(ca)
+
+    # cleanup: rebuild once instead of popping one by one
+    if to_remove:
+        to_remove_set = set(to_remove)
+        with _STATE_LOCK:
+            WATCHLIST = {k: v for k, v in WATCHLIST.items() if k not in to_remove_set}
 
 
 def monitor_loop():
     # Start without console output; send single "started" Telegram message optionally
     # send_telegram("🚀 Graduate monitor started")  # uncomment if you want a startup message
+    delay = CFG.poll_interval
     while True:
         try:
-            update_watchlist_from_search()
+            seen_pairs = update_watchlist_from_search()
             evaluate_watchlist()
+            if seen_pairs:
+                delay = CFG.poll_interval
+            else:
+                # empty/unreachable feed: back off instead of hammering
+                delay = min(delay * 2, 300)
         except Exception:
             # silent
-            pass
-        time.sleep(POLL_INTERVAL)
+            delay = min(delay * 2, 300)
+        time.sleep(delay)
+
 
+# === Keepalive endpoint (Render) ===
+class KeepaliveHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = b"Pump.fun -> DexScreener Graduate Watcher (running)"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Silent: we purposely avoid console logs
+        pass
 
-# === Flask keepalive endpoint ===
-@app.route("/")
-def index():
-    return "Pump.fun -> DexScreener Graduate Watcher (running)"
 
 if __name__ == "__main__":
-    # Start monitor thread
+    # Start Telegram sender + monitor threads
+    Thread(target=telegram_sender_loop, daemon=True).start()
     t = Thread(target=monitor_loop, daemon=True)
     t.start()
-    # Run Flask app (will keep process alive on Render)
-    app.run(host="0.0.0.0", port=int(os.environ.get("PORT", 5000)))
+    # Serve the keepalive endpoint (keeps process alive on Render)
+    server = ThreadingHTTPServer(("0.0.0.0", int(os.environ.get("PORT", 5000))), KeepaliveHandler)
+    server.serve_forever()